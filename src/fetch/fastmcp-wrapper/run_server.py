@@ -0,0 +1,5 @@
+#!/usr/bin/env python3
+import sys
+from mcp_server_fetch import main
+if __name__ == "__main__":
+    main()
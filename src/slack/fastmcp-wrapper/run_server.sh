@@ -0,0 +1,3 @@
+#!/bin/bash
+cd /app
+./slack-mcp-server -transport stdio
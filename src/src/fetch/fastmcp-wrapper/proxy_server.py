@@ -4,57 +4,76 @@ FastMCP v2 Proxy Wrapper for MCP fetch Server
 Uses FastMCP's built-in proxy capabilities to wrap the stdio server
 """
 
+import asyncio
 import os
 import sys
-from fastmcp import FastMCP
-from fastmcp.server.proxy import ProxyClient
+from fastmcp.client.transports import StdioTransport
+from fastmcp.server.proxy import FastMCPProxy, ProxyClient
+from hypercorn.asyncio import serve
+from hypercorn.config import Config
+from starlette.middleware import Middleware
 
-# Create a wrapper script file for the original server
+from auth import REQUIRE_JWT, JWTAuthMiddleware
+
+if sys.platform != "win32":
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+# Launcher for the original server, baked into the image at build time
 wrapper_script = "/app/run_server.py"
-with open(wrapper_script, "w") as f:
-    f.write("""#!/usr/bin/env python3
-import sys
-from mcp_server_fetch import main
-if __name__ == "__main__":
-    main()
-""")
-os.chmod(wrapper_script, 0o755)
-
-# Create FastMCP proxy that wraps the original stdio server
-proxy = FastMCP.as_proxy(
-    ProxyClient(wrapper_script),
-    name="fetch-server-proxy"
-)
-
-# Optional: Add JWT authentication middleware
-if os.environ.get('REQUIRE_JWT') == 'true':
-    @proxy.middleware
-    async def jwt_auth(request, call_next):
-        """JWT authentication middleware"""
-        auth_header = request.headers.get('Authorization', '')
-        token = auth_header.replace('Bearer ', '')
-        
-        if not token or not token.startswith('mcp_jwt_'):
-            return {
-                'jsonrpc': '2.0',
-                'error': {
-                    'code': -32001,
-                    'message': 'Unauthorized - Invalid or missing JWT token'
-                },
-                'id': None
-            }
-        
-        # In production, validate JWT properly here
-        return await call_next(request)
+
+def new_client():
+    """Create a client that launches the original server over stdio"""
+    return ProxyClient(StdioTransport(sys.executable, [wrapper_script]))
+
+def session_closed(client):
+    """Whether client has no live session to the original server"""
+    if not client.is_connected():
+        return True
+    # The session closes its write stream once the original server's stdout hits EOF
+    return client.session._write_stream._closed
+
+# One connected client shared by every request, so the original server is
+# started and initialized once. Requests share its session: logs, progress,
+# sampling and elicitation from the original server are not forwarded to the
+# requesting client
+client = new_client()
+reconnect_lock = asyncio.Lock()
+
+async def connected_client():
+    """Return the shared client, reconnecting it first if the original server died"""
+    global client
+    if session_closed(client):
+        async with reconnect_lock:
+            if session_closed(client):
+                dead, client = client, new_client()
+                await dead.close()
+                await client.__aenter__()
+    return client
+
+proxy = FastMCPProxy(client_factory=connected_client, name="fetch-server-proxy")
+
+# Optional: JWT authentication, enforced on the HTTP transport only
+middleware = [Middleware(JWTAuthMiddleware)] if REQUIRE_JWT else []
+
+async def main(transport, port):
+    # Connect once at startup so the first request does not pay for the handshake
+    await connected_client()
+    try:
+        if transport == 'http':
+            # For cloud deployment - Streamable-HTTP served over HTTP/2 (h2c) with keep-alive
+            config = Config()
+            config.bind = [f"0.0.0.0:{port}"]
+            config.keep_alive_timeout = 75
+            await serve(proxy.http_app(path="/", middleware=middleware), config)
+        else:
+            # Default stdio for local use, a local pipe carries no Authorization header
+            await proxy.run_async(transport="stdio")
+    finally:
+        await client.close()
 
 if __name__ == "__main__":
     # Run with modern HTTP transport (not deprecated SSE)
     transport = os.environ.get('MCP_TRANSPORT', 'http')
     port = int(os.environ.get('PORT', 8080))
-    
-    if transport == 'http':
-        # For cloud deployment - HTTP/2 ready Streamable-HTTP transport
-        proxy.run(transport="http", host="0.0.0.0", port=port, path="/")
-    else:
-        # Default stdio for local use
-        proxy.run(transport="stdio")
+    asyncio.run(main(transport, port))
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Shared JWT authentication for the FastMCP proxy wrappers
+Verified payloads are kept in a bounded TTL cache keyed by a token digest
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+
+import jwt
+from cachetools import TTLCache
+from starlette.datastructures import Headers
+from starlette.responses import Response
+
+BEARER_PREFIX = 'Bearer '
+TOKEN_PREFIX = 'mcp_jwt_'
+
+# Serialized once and sent as-is for every rejected request, as immutable bytes
+UNAUTHORIZED_BODY = json.dumps({
+    'jsonrpc': '2.0',
+    'error': {
+        'code': -32001,
+        'message': 'Unauthorized - Invalid or missing JWT token'
+    },
+    'id': None
+}, separators=(',', ':')).encode()
+
+REQUIRE_JWT = os.environ.get('REQUIRE_JWT') == 'true'
+JWT_SECRET = os.environ.get('JWT_SECRET', '')
+JWT_ALGORITHMS = os.environ.get('JWT_ALGORITHMS', 'HS256').split(',')
+JWT_CACHE_TTL = float(os.environ.get('JWT_CACHE_TTL', 30))
+JWT_CACHE_SIZE = int(os.environ.get('JWT_CACHE_SIZE', 10000))
+
+_cache = TTLCache(maxsize=JWT_CACHE_SIZE, ttl=JWT_CACHE_TTL)
+_lock = threading.Lock()
+
+if REQUIRE_JWT and not JWT_SECRET:
+    logging.getLogger(__name__).warning(
+        'REQUIRE_JWT is set but JWT_SECRET is empty, any mcp_jwt_ token will be accepted')
+
+
+def _decode(token):
+    """Verify the token signature and claims, returning the payload or None"""
+    if not JWT_SECRET:
+        # No signing key configured: keep accepting any prefixed token
+        return {}
+    try:
+        return jwt.decode(token[len(TOKEN_PREFIX):], JWT_SECRET, algorithms=JWT_ALGORITHMS)
+    except jwt.InvalidTokenError:
+        return None
+
+
+def verify_cached(token):
+    """Return the verified payload for token, or None if it is invalid"""
+    key = hashlib.sha256(token.encode()).digest()[:16]
+    now = time.time()
+
+    with _lock:
+        entry = _cache.get(key)
+    if entry is not None:
+        payload, expires_at = entry
+        if expires_at > now:
+            return payload
+
+    payload = _decode(token)
+    if payload is None:
+        return None
+
+    expires_at = min(payload.get('exp', now + JWT_CACHE_TTL), now + JWT_CACHE_TTL)
+    with _lock:
+        _cache[key] = (payload, expires_at)
+    return payload
+
+
+def is_authorized(auth_header):
+    """Check an Authorization header value for a valid bearer JWT"""
+    if not auth_header.startswith(BEARER_PREFIX):
+        return False
+    token = auth_header[len(BEARER_PREFIX):]
+    return token.startswith(TOKEN_PREFIX) and verify_cached(token) is not None
+
+
+class JWTAuthMiddleware:
+    """ASGI middleware answering 401 to HTTP requests without a valid JWT"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        # CORS preflights never carry the Authorization header
+        if scope['type'] == 'http' and scope['method'] != 'OPTIONS':
+            if not is_authorized(Headers(scope=scope).get('authorization', '')):
+                response = Response(UNAUTHORIZED_BODY, status_code=401, media_type='application/json')
+                await response(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
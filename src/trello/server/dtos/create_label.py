@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class CreateLabelPayload(BaseModel):
@@ -10,5 +10,7 @@ class CreateLabelPayload(BaseModel):
         color (str): The color of the label.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid", str_strip_whitespace=True)
+
     name: str
     color: str | None = None
\ No newline at end of file
@@ -32,6 +32,13 @@ class TrelloLabel(BaseModel):
     color: str | None = None
 
 
+class TrelloBoardWithLabels(BaseModel):
+    """Model representing a Trello board together with its labels."""
+
+    board: TrelloBoard
+    labels: List[TrelloLabel]
+
+
 class TrelloCard(BaseModel):
     """Model representing a Trello card."""
 
@@ -2,11 +2,18 @@
 Service for managing Trello boards in MCP server.
 """
 
+import asyncio
 from typing import List
 
-from server.models import TrelloBoard, TrelloLabel
+from pydantic import TypeAdapter
+
+from server.dtos.create_label import CreateLabelPayload
+from server.models import TrelloBoard, TrelloBoardWithLabels, TrelloLabel
 from server.utils.trello_api import TrelloClient
 
+_BOARDS_ADAPTER = TypeAdapter(List[TrelloBoard])
+_LABELS_ADAPTER = TypeAdapter(List[TrelloLabel])
+
 
 class BoardService:
     """
@@ -26,7 +33,7 @@ class BoardService:
             TrelloBoard: The board object containing board details.
         """
         response = await self.client.GET(f"/boards/{board_id}")
-        return TrelloBoard(**response)
+        return TrelloBoard.model_validate(response)
 
     async def get_boards(self, member_id: str = "me") -> List[TrelloBoard]:
         """Retrieves all boards for a given member.
@@ -38,7 +45,7 @@ class BoardService:
             List[TrelloBoard]: A list of board objects.
         """
         response = await self.client.GET(f"/members/{member_id}/boards")
-        return [TrelloBoard(**board) for board in response]
+        return _BOARDS_ADAPTER.validate_python(response)
 
     async def get_board_labels(self, board_id: str) -> List[TrelloLabel]:
         """Retrieves all labels for a specific board.
@@ -50,16 +57,40 @@ class BoardService:
             List[TrelloLabel]: A list of label objects for the board.
         """
         response = await self.client.GET(f"/boards/{board_id}/labels")
-        return [TrelloLabel(**label) for label in response]
+        return _LABELS_ADAPTER.validate_python(response)
+
+    async def get_board_with_labels(self, board_id: str) -> TrelloBoardWithLabels:
+        """Retrieves a board together with its labels, fetching both concurrently.
 
-    async def create_board_label(self, board_id: str, **kwargs) -> TrelloLabel:
+        Args:
+            board_id (str): The ID of the board to retrieve.
+
+        Returns:
+            TrelloBoardWithLabels: The board object and its labels.
+        """
+        board, labels = await asyncio.gather(
+            self.client.GET(f"/boards/{board_id}"),
+            self.client.GET(f"/boards/{board_id}/labels"),
+        )
+        return TrelloBoardWithLabels(
+            board=TrelloBoard.model_validate(board),
+            labels=_LABELS_ADAPTER.validate_python(labels),
+        )
+
+    async def create_board_label(
+        self, board_id: str, payload: CreateLabelPayload
+    ) -> TrelloLabel:
         """Create label for a specific board.
 
         Args:
             board_id (str): The ID of the board whose to add label.
+            payload (CreateLabelPayload): The name and color of the new label.
 
         Returns:
-            List[TrelloLabel]: A list of label objects for the board.
+            TrelloLabel: The newly created label object.
         """
-        response = await self.client.POST(f"/boards/{board_id}/labels", data=kwargs)
-        return TrelloLabel(**response)
+        response = await self.client.POST(
+            f"/boards/{board_id}/labels",
+            data=payload.model_dump(mode="json", exclude_none=True),
+        )
+        return TrelloLabel.model_validate(response)
@@ -7,7 +7,7 @@ from typing import List
 
 from mcp.server.fastmcp import Context
 
-from server.models import TrelloBoard, TrelloLabel
+from server.models import TrelloBoard, TrelloBoardWithLabels, TrelloLabel
 from server.dtos.create_label import CreateLabelPayload
 from server.services.board import BoardService
 from server.trello import client
@@ -77,6 +77,27 @@ async def get_board_labels(ctx: Context, board_id: str) -> List[TrelloLabel]:
         raise
 
 
+async def get_board_with_labels(ctx: Context, board_id: str) -> TrelloBoardWithLabels:
+    """Retrieves a specific board together with all of its labels.
+
+    Args:
+        board_id (str): The ID of the board to retrieve.
+
+    Returns:
+        TrelloBoardWithLabels: The board object and its labels.
+    """
+    try:
+        logger.info(f"Getting board with labels: {board_id}")
+        result = await service.get_board_with_labels(board_id)
+        logger.info(f"Successfully retrieved board {board_id} with {len(result.labels)} labels")
+        return result
+    except Exception as e:
+        error_msg = f"Failed to get board with labels: {str(e)}"
+        logger.error(error_msg)
+        await ctx.error(error_msg)
+        raise
+
+
 async def create_board_label(ctx: Context, board_id: str, payload: CreateLabelPayload) -> TrelloLabel:
     """Create label for a specific board.
 
@@ -90,7 +111,7 @@ async def create_board_label(ctx: Context, board_id: str, payload: CreateLabelPa
     """
     try:
         logger.info(f"Creating label {payload.name} label for board: {board_id}")
-        result = await service.create_board_label(board_id, **payload.model_dump(exclude_unset=True))
+        result = await service.create_board_label(board_id, payload)
         logger.info(f"Successfully created label {payload.name} labels for board: {board_id}")
         return result
     except Exception as e:
@@ -3,7 +3,7 @@ import os
 
 from dotenv import load_dotenv
 
-from server.utils.trello_api import TrelloClient
+from server.utils.trello_api import CACHE_TTL, TrelloClient
 
 # Configure logging
 logging.basicConfig(
@@ -23,7 +23,8 @@ try:
         raise ValueError(
             "TRELLO_API_KEY and TRELLO_TOKEN must be set in environment variables"
         )
-    client = TrelloClient(api_key=api_key, token=token)
+    cache_ttl = float(os.getenv("TRELLO_CACHE_TTL", CACHE_TTL))
+    client = TrelloClient(api_key=api_key, token=token, cache_ttl=cache_ttl)
     logger.info("Trello client and service initialized successfully")
 except Exception as e:
     logger.error(f"Failed to initialize Trello client: {str(e)}")
@@ -39,6 +40,7 @@ def trello_help() -> str:
        - Get a specific board
        - List all boards
        - Get board labels
+       - Get a board together with its labels
        - Add label to a board
     2. List Operations:
        - Get a specific list
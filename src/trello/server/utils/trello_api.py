@@ -1,5 +1,7 @@
 # trello_api.py
+import asyncio
 import logging
+import time
 
 import httpx
 
@@ -8,22 +10,81 @@ logger = logging.getLogger(__name__)
 
 TRELLO_API_BASE = "https://api.trello.com/1"
 
+# GET responses are reused for this many seconds, writes clear the cache
+CACHE_TTL = 30
+CACHE_MAXSIZE = 2048
+
 
 class TrelloClient:
     """
     Client class for interacting with the Trello API over REST.
     """
 
-    def __init__(self, api_key: str, token: str):
+    def __init__(self, api_key: str, token: str, cache_ttl: float = CACHE_TTL):
         self.api_key = api_key
         self.token = token
         self.base_url = TRELLO_API_BASE
         self.client = httpx.AsyncClient(base_url=self.base_url)
+        self.cache_ttl = cache_ttl
+        self._cache = {}
+        self._inflight = {}
+        self._generation = 0
 
     async def close(self):
         await self.client.aclose()
 
+    def invalidate_cache(self):
+        """Drops all cached GET responses."""
+        self._cache.clear()
+        self._inflight.clear()
+        self._generation += 1
+
     async def GET(self, endpoint: str, params: dict = None):
+        if self.cache_ttl <= 0:
+            return await self._get(endpoint, params)
+
+        key = (endpoint, tuple(sorted(params.items())) if params else ())
+        cached = self._cache.get(key)
+        if cached is not None:
+            if cached[0] > time.monotonic():
+                return cached[1]
+            del self._cache[key]
+
+        # Concurrent misses for the same endpoint share one upstream request
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._get_and_cache(key, self._generation, endpoint, params)
+            )
+            self._inflight[key] = task
+        return await asyncio.shield(task)
+
+    async def _get_and_cache(
+        self, key: tuple, generation: int, endpoint: str, params: dict = None
+    ):
+        try:
+            data = await self._get(endpoint, params)
+        finally:
+            if self._inflight.get(key) is asyncio.current_task():
+                del self._inflight[key]
+        # Skip storing if a write happened while the request was in flight
+        if generation == self._generation:
+            # Re-insert so a refreshed entry counts as the newest
+            self._cache.pop(key, None)
+            if len(self._cache) >= CACHE_MAXSIZE:
+                self._evict()
+            self._cache[key] = (time.monotonic() + self.cache_ttl, data)
+        return data
+
+    def _evict(self):
+        """Makes room for one entry, dropping expired entries before live ones."""
+        now = time.monotonic()
+        for key in [k for k, (expires_at, _) in self._cache.items() if expires_at <= now]:
+            del self._cache[key]
+        if len(self._cache) >= CACHE_MAXSIZE:
+            del self._cache[next(iter(self._cache))]
+
+    async def _get(self, endpoint: str, params: dict = None):
         all_params = {"key": self.api_key, "token": self.token}
         if params:
             all_params.update(params)
@@ -58,6 +119,8 @@ class TrelloClient:
         except httpx.RequestError as e:
             logger.error(f"Request error: {e}")
             raise httpx.RequestError(f"Failed to post to {endpoint}: {str(e)}")
+        finally:
+            self.invalidate_cache()
 
     async def PUT(self, endpoint: str, data: dict = None):
         all_params = {"key": self.api_key, "token": self.token}
@@ -75,6 +138,8 @@ class TrelloClient:
         except httpx.RequestError as e:
             logger.error(f"Request error: {e}")
             raise httpx.RequestError(f"Failed to put to {endpoint}: {str(e)}")
+        finally:
+            self.invalidate_cache()
 
     async def DELETE(self, endpoint: str, params: dict = None):
         all_params = {"key": self.api_key, "token": self.token}
@@ -94,3 +159,5 @@ class TrelloClient:
         except httpx.RequestError as e:
             logger.error(f"Request error: {e}")
             raise httpx.RequestError(f"Failed to delete {endpoint}: {str(e)}")
+        finally:
+            self.invalidate_cache()
@@ -0,0 +1,128 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from server.utils import trello_api
+from server.utils.trello_api import TrelloClient
+
+
+class FakeTrelloClient(TrelloClient):
+    """TrelloClient whose upstream GETs are counted instead of sent."""
+
+    def __init__(self, **kwargs):
+        super().__init__("key", "token", **kwargs)
+        self.calls = []
+        self.release = None
+
+    async def _get(self, endpoint: str, params: dict = None):
+        self.calls.append(endpoint)
+        if self.release is not None:
+            await self.release.wait()
+        return {"endpoint": endpoint, "call": len(self.calls)}
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(trello_api, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    return now
+
+
+def test_get_reuses_cached_response(clock):
+    client = FakeTrelloClient()
+
+    async def run():
+        first = await client.GET("/boards/1")
+        second = await client.GET("/boards/1")
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert first == second
+    assert client.calls == ["/boards/1"]
+
+
+def test_get_refetches_after_ttl(clock):
+    client = FakeTrelloClient(cache_ttl=30)
+
+    async def run():
+        await client.GET("/boards/1")
+        clock[0] += 31
+        return await client.GET("/boards/1")
+
+    assert asyncio.run(run())["call"] == 2
+
+
+def test_concurrent_gets_share_one_request(clock):
+    client = FakeTrelloClient()
+
+    async def run():
+        client.release = asyncio.Event()
+        pending = asyncio.gather(*(client.GET("/boards/1") for _ in range(5)))
+        await asyncio.sleep(0)
+        client.release.set()
+        return await pending
+
+    results = asyncio.run(run())
+    assert client.calls == ["/boards/1"]
+    assert all(result == results[0] for result in results)
+
+
+def test_write_during_get_skips_caching(clock):
+    client = FakeTrelloClient()
+
+    async def run():
+        client.release = asyncio.Event()
+        pending = asyncio.ensure_future(client.GET("/boards/1"))
+        await asyncio.sleep(0)
+        client.invalidate_cache()
+        client.release.set()
+        await pending
+        client.release = None
+        return await client.GET("/boards/1")
+
+    assert asyncio.run(run())["call"] == 2
+    assert client.calls == ["/boards/1", "/boards/1"]
+
+
+def test_refreshing_a_key_keeps_other_entries(clock, monkeypatch):
+    monkeypatch.setattr(trello_api, "CACHE_MAXSIZE", 2)
+    client = FakeTrelloClient(cache_ttl=300)
+
+    async def run():
+        await client.GET("/boards/2")
+        client.cache_ttl = 30
+        await client.GET("/boards/1")
+        clock[0] += 31
+        await client.GET("/boards/1")
+
+    asyncio.run(run())
+    assert client.calls == ["/boards/2", "/boards/1", "/boards/1"]
+    assert set(client._cache) == {("/boards/1", ()), ("/boards/2", ())}
+
+
+def test_eviction_drops_expired_entries_first(clock, monkeypatch):
+    monkeypatch.setattr(trello_api, "CACHE_MAXSIZE", 2)
+    client = FakeTrelloClient(cache_ttl=300)
+
+    async def run():
+        await client.GET("/boards/1")
+        client.cache_ttl = 30
+        await client.GET("/boards/2")
+        clock[0] += 31
+        await client.GET("/boards/3")
+
+    asyncio.run(run())
+    assert set(client._cache) == {("/boards/1", ()), ("/boards/3", ())}
+
+
+def test_eviction_drops_oldest_live_entry_when_full(clock, monkeypatch):
+    monkeypatch.setattr(trello_api, "CACHE_MAXSIZE", 2)
+    client = FakeTrelloClient(cache_ttl=30)
+
+    async def run():
+        for board in (1, 2, 3):
+            await client.GET(f"/boards/{board}")
+
+    asyncio.run(run())
+    assert set(client._cache) == {("/boards/2", ()), ("/boards/3", ())}
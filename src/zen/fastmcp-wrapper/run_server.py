@@ -0,0 +1,7 @@
+#!/usr/bin/env python3
+import sys
+import os
+sys.path.append('/app')
+from server import main
+if __name__ == "__main__":
+    main()